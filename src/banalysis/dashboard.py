@@ -6,20 +6,39 @@
 
 ##### IMPORTS #####
 # Standard imports
-import io
 import base64
-import math
 import datetime as dt
+import functools
+from concurrent import futures
 
 # Third party imports
 import numpy as np
+import pandas as pd
 from bokeh import models, layouts, plotting
 
 # Local imports
-from . import inputs
+from . import inputs, utils
 
 
 ##### CONSTANTS #####
+_EPOCH = dt.datetime(1970, 1, 1)
+MAX_LINE_POINTS = 2000
+# Table cell template colouring values based on sign
+_AMOUNT_TEMPLATE = """
+<div style="color:<%= 
+    (function colorfromint(){
+        if(value < 0){
+            return("red")
+        }
+        else if(value > 0){
+            return("green")
+        }
+        else {
+            return("gray")
+        }
+    }()) %>;"> 
+<%= (value).toFixed(2) %></div>
+"""
 
 ##### CLASSES #####
 class Dashboard:
@@ -34,7 +53,14 @@ class Dashboard:
             to, usually just `curdoc()`.
         """
         self.doc = doc
+        # Single worker so uploads are parsed in the order they're given
+        self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        self.doc.on_session_destroyed(self._shutdown)
         self.source = models.ColumnDataSource(inputs.EMPTY_MIDATA)
+        # Downsampled balance line, `source` contains all transactions
+        self.line_source = models.ColumnDataSource(
+            inputs.EMPTY_MIDATA.loc[:, ["date", "balance"]]
+        )
         self.file = models.FileInput(accept=".csv,.txt", sizing_mode="fixed")
         self.file.on_change("value", self._update_source)
         self.data_table = self.init_table()
@@ -57,22 +83,7 @@ class Dashboard:
             Table object with columns for bank transaction
             data provided in midata format.
         """
-        template = """
-            <div style="color:<%= 
-                (function colorfromint(){
-                    if(value < 0){
-                        return("red")
-                    }
-                    else if(value > 0){
-                        return("green")
-                    }
-                    else {
-                        return("gray")
-                    }
-                }()) %>;"> 
-            <%= (value).toFixed(2) %></div>
-        """
-        formatter = models.HTMLTemplateFormatter(template=template)
+        formatter = models.HTMLTemplateFormatter(template=_AMOUNT_TEMPLATE)
         table_width = 600
         width = lambda x: int(table_width * x)
         columns = [
@@ -101,6 +112,8 @@ class Dashboard:
                 width=width(0.15),
             ),
         ]
+        # DataTable (SlickGrid) only renders the visible rows so the full
+        # source can be given without needing to paginate
         table = models.DataTable(
             source=self.source,
             columns=columns,
@@ -110,17 +123,43 @@ class Dashboard:
         )
         return table
 
+    def _shutdown(self, session_context):  # pylint: disable=unused-argument
+        """Stop the parsing thread when the Bokeh session is closed."""
+        self._executor.shutdown(wait=False)
+
     def _update_source(self, attr, old, new):  # pylint: disable=unused-argument
-        """Function to update the data `source` when new file inputs are given."""
-        decoded = base64.b64decode(new)
-        f = io.BytesIO(decoded)
-        df = inputs.read_midata(f)
-        self.source.data = df
-
-        self.all_plot.x_range = models.DataRange1d(bounds=(min(df.date), max(df.date)))
-        max_amount = (
-            math.ceil(np.max(df[["balance", "abs_amount"]].values) / 1000) * 1000
+        """Function to update the data `source` when new file inputs are given.
+
+        The file is parsed in a background thread so the document isn't locked
+        while reading, the sources are then updated on the next tick.
+        """
+        future = self._executor.submit(_parse_upload, new)
+        future.add_done_callback(self._parsed)
+
+    def _parsed(self, future: futures.Future):
+        """Schedule the sources update once the uploaded file has been parsed."""
+        self.doc.add_next_tick_callback(functools.partial(self._apply_data, future))
+
+    def _apply_data(self, future: futures.Future):
+        """Update the sources and plot ranges with the parsed midata.
+
+        Parameters
+        ----------
+        future : futures.Future
+            Completed future containing the midata DataFrame, any
+            errors from parsing are raised here.
+        """
+        df = future.result()
+        self.source.data = {c: _column_array(df[c]) for c in df.columns}
+        self.line_source.data = _downsample_balance(
+            self.source.data["date"], self.source.data["balance"]
         )
+
+        self.all_plot.x_range = models.DataRange1d(
+            bounds=(df.date.min(), df.date.max())
+        )
+        # Round up to the nearest 1000 using floor division
+        max_amount = -(-max(df["balance"].max(), df["abs_amount"].max()) // 1000) * 1000
         self.all_plot.y_range = models.DataRange1d(bounds=(0, max_amount))
 
     def plot_all(self) -> plotting.Figure:
@@ -160,6 +199,7 @@ class Dashboard:
             x_axis_label="Date",
             y_axis_label="Amount (£)",
             sizing_mode="stretch_both",
+            output_backend="webgl",
             tools=[
                 "pan",
                 "box_select",
@@ -172,14 +212,11 @@ class Dashboard:
         )
         p.xaxis[0].formatter = models.DatetimeTickFormatter()
         p.y_range = models.DataRange1d(bounds=(0, 10000))
-        epoch = dt.datetime.utcfromtimestamp(0)
-        max_date = (dt.datetime.today() - epoch).total_seconds()
-        min_date = max_date - (2 * 365 * 24 * 60 * 60)
-        p.x_range = models.DataRange1d(bounds=(min_date * 1000, max_date * 1000))
+        p.x_range = models.DataRange1d(bounds=_default_date_range(dt.date.today()))
         p.line(
             x="date",
             y="balance",
-            source=self.source,
+            source=self.line_source,
             legend_label="Balance",
             name="balance",
             line_width=2,
@@ -197,3 +234,81 @@ class Dashboard:
 
         p.legend.click_policy = "hide"
         return p
+
+
+##### FUNCTIONS #####
+@functools.lru_cache(maxsize=1)
+def _default_date_range(today: dt.date) -> tuple[int, int]:
+    """Calculate the default date axis bounds, covering the last 2 years.
+
+    Parameters
+    ----------
+    today : dt.date
+        Date to use as the upper bound, the result is cached
+        so only recalculated when the date changes.
+
+    Returns
+    -------
+    int
+        Lower bound in milliseconds since epoch.
+    int
+        Upper bound in milliseconds since epoch.
+    """
+    max_date = int((dt.datetime.combine(today, dt.time()) - _EPOCH).total_seconds())
+    min_date = max_date - (2 * 365 * 24 * 60 * 60)
+    return min_date * 1000, max_date * 1000
+
+
+def _parse_upload(value: str) -> pd.DataFrame:
+    """Decode and read the base64 encoded midata file from `FileInput`."""
+    return inputs.read_midata_arrow(base64.b64decode(value))
+
+
+def _column_array(column: pd.Series) -> np.ndarray:
+    """Convert DataFrame column to numpy array for a ColumnDataSource.
+
+    Numeric and datetime columns are converted to contiguous arrays,
+    any other (e.g. Arrow-backed string) columns are converted to object
+    arrays in a single call, with missing values replaced by "".
+
+    Parameters
+    ----------
+    column : pd.Series
+        Column from the midata DataFrame.
+
+    Returns
+    -------
+    np.ndarray
+        Column values.
+    """
+    if column.dtype.kind in "fiuM":
+        return np.ascontiguousarray(column.to_numpy())
+    return column.to_numpy(dtype=object, na_value="")
+
+
+def _downsample_balance(date: np.ndarray, balance: np.ndarray) -> dict:
+    """Downsample the balance line to at most `MAX_LINE_POINTS` points.
+
+    Parameters
+    ----------
+    date : np.ndarray
+        Transaction dates as datetime64 values.
+    balance : np.ndarray
+        Balance after each transaction.
+
+    Returns
+    -------
+    dict
+        Data for the line ColumnDataSource containing the
+        "date" and "balance" columns, in ascending date order.
+    """
+    # Keep file order within each day when the dates are already monotonic
+    diff = np.diff(date)
+    if np.all(diff <= np.timedelta64(0)):
+        date, balance = date[::-1], balance[::-1]
+    elif not np.all(diff >= np.timedelta64(0)):
+        order = np.argsort(date, kind="stable")
+        date, balance = date[order], balance[order]
+    x = date.astype("datetime64[ms]").astype(np.float64)
+    keep = utils.lttb_indices(x, balance, MAX_LINE_POINTS)
+    return {"date": date[keep], "balance": balance[keep]}
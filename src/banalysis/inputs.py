@@ -5,23 +5,31 @@
 
 ##### IMPORTS #####
 # Standard imports
+import csv
 import logging
 from pathlib import Path
+from typing import BinaryIO, Union
 
 # Third party imports
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 # Local imports
 from . import errors as ban_errors
 
 ##### CONSTANTS #####
 LOG = logging.getLogger(__name__)
+CSV_BLOCK_SIZE = 1 << 20
+MIDATA_COLUMNS = ["date", "type", "merchant/description", "debit/credit", "balance"]
+_EXPECTED = frozenset(MIDATA_COLUMNS)
 EMPTY_MIDATA = pd.DataFrame(
     columns=["date", "type", "description", "amount", "abs_amount", "colour", "balance"]
 )
 
 ##### FUNCTIONS #####
-def read_midata(path: Path) -> pd.DataFrame:
+def read_midata(path: Union[Path, str, BinaryIO]) -> pd.DataFrame:
     """Read CSV in midata format.
 
     Checks all required columns are present in the CSV
@@ -29,9 +37,11 @@ def read_midata(path: Path) -> pd.DataFrame:
 
     Parameters
     ----------
-    path : Path, str or file-like object
-        Path to the CSV file or file-like object to be
-        passed to `pandas.read_csv`. The file should be
+    path : Path, str or binary file-like object
+        Local path to the CSV file or file-like object opened
+        in binary mode, URLs and text mode file-like objects
+        aren't supported. Contents are parsed with
+        `read_midata_arrow`. The file should be
         in midata format containing the following
         columns: date, type, merchant/description,
         debit/credit and balance.
@@ -43,29 +53,149 @@ def read_midata(path: Path) -> pd.DataFrame:
         date, type, description, amount, abs_amount,
         colour and balance.
 
+    Raises
+    ------
+    MidataCSVError
+        If any required columns are missing.
+    TypeError
+        If `path` is a file-like object opened in text mode.
+    """
+    if hasattr(path, "read"):
+        buffer = path.read()
+        if not isinstance(buffer, bytes):
+            raise TypeError(
+                "midata file-like object should be opened in binary mode, "
+                f"read returned {type(buffer).__name__}"
+            )
+    else:
+        buffer = Path(path).read_bytes()
+    return read_midata_arrow(buffer)
+
+
+def read_midata_arrow(buffer: bytes) -> pd.DataFrame:
+    """Read CSV in midata format from an in-memory buffer.
+
+    Uses `pyarrow.csv.read_csv` directly on a zero-copy
+    `pyarrow.BufferReader`, with multi-threaded block
+    parsing, so the buffer doesn't need wrapping in a
+    Python file-like object. Only the expected columns
+    are parsed and they're all read as strings, so no
+    type inference is done. The overdraft footer row,
+    if present, is removed before parsing.
+
+    Parameters
+    ----------
+    buffer : bytes
+        Contents of the midata CSV file, see `read_midata`
+        for the expected columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with the same columns as `read_midata`.
+
+    Raises
+    ------
+    MidataCSVError
+        If any required columns are missing.
+    """
+    # Find the expected columns from the header, as names may differ in case/spacing
+    newline = buffer.find(b"\n")
+    header = buffer[:newline if newline >= 0 else None].decode("utf-8-sig")
+    names = [c for c in next(csv.reader([header])) if c.strip().lower() in _EXPECTED]
+    table = pa_csv.read_csv(
+        pa.BufferReader(_drop_footer(buffer)),
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=names, column_types=dict.fromkeys(names, pa.string())
+        ),
+    )
+    return _clean_midata(table.to_pandas(types_mapper=pd.ArrowDtype))
+
+
+def _drop_footer(buffer: bytes) -> memoryview:
+    """Remove the overdraft footer line from the midata CSV contents.
+
+    The last line of midata CSVs can contain the arranged overdraft
+    limit, which may have fewer fields than the header so has to be
+    removed before parsing with pyarrow.
+
+    Parameters
+    ----------
+    buffer : bytes
+        Contents of the midata CSV file.
+
+    Returns
+    -------
+    memoryview
+        Zero-copy view of `buffer` without the footer line.
+    """
+    end = len(buffer)
+    while end > 0 and buffer[end - 1 : end].isspace():
+        end -= 1
+    start = buffer.rfind(b"\n", 0, end) + 1
+    view = memoryview(buffer)
+    if start > 0 and buffer[start:end].lstrip(b' "').lower().startswith(b"arranged"):
+        return view[:start]
+    return view
+
+
+def _clean_midata(df: pd.DataFrame) -> pd.DataFrame:
+    """Check columns and convert values in Arrow-backed midata DataFrame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Arrow-backed DataFrame read from the midata CSV.
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with the same columns as `read_midata`.
+
     Raises
     ------
     MidataCSVError
         If any required columns are missing.
     """
-    df = pd.read_csv(path)
     df = _check_midata_columns(df)
-    # Drop last row which contains overdraft data
-    if df.iat[-1, 0].lower().startswith("arranged"):
-        df.drop(df.index[-1], inplace=True)
     # Assume that all balance and amount values are in £ and convert to numbers
-    for c in ("amount", "balance"):
-        df[c] = pd.to_numeric(df[c].str.replace("£", ""), errors="raise")
-    df["date"] = pd.to_datetime(df["date"], format="%d/%m/%Y", errors="raise").dt.date
+    currency_columns = ["amount", "balance"]
+    df[currency_columns] = df[currency_columns].apply(_pounds_to_float)
+    df["date"] = pd.to_datetime(
+        df["date"], format="%d/%m/%Y", errors="raise", cache=True
+    )
+    # Only a handful of transaction types so store as codes
+    df["type"] = df["type"].astype("category")
 
-    df["abs_amount"] = abs(df["amount"])
+    amount = df["amount"].to_numpy(dtype=np.float64, na_value=np.nan)
+    df["abs_amount"] = np.abs(amount)
     # Colour amounts based on negative/positive values
-    df.loc[df["amount"] < 0, "colour"] = "red"
-    df.loc[df["amount"] == 0, "colour"] = "grey"
-    df.loc[df["amount"] > 0, "colour"] = "green"
+    df["colour"] = np.select([amount < 0, amount > 0], ["red", "green"], "grey")
     return df
 
 
+def _pounds_to_float(values: pd.Series) -> pd.Series:
+    """Convert Arrow-backed string column of £ values to floats.
+
+    The sign may come before the £ symbol (e.g. "-£12.50")
+    so a literal (non-regex) replace is used rather than
+    removing a prefix, both the replace and the cast are
+    done with pyarrow compute kernels.
+
+    Parameters
+    ----------
+    values : pd.Series
+        Arrow-backed string column containing £ values.
+
+    Returns
+    -------
+    pd.Series
+        Arrow-backed float64 column.
+    """
+    return values.str.replace("£", "", regex=False).astype("float64[pyarrow]")
+
+
 def _check_midata_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Check and rename the columns in midata DataFrame.
 
@@ -87,21 +217,17 @@ def _check_midata_columns(df: pd.DataFrame) -> pd.DataFrame:
     MidataCSVError
         If any expected columns aren't present.
     """
-    df.columns = [c.strip().lower() for c in df.columns.tolist()]
-    columns = ["date", "type", "merchant/description", "debit/credit", "balance"]
-    missing = []
-    for c in columns:
-        if c not in df.columns.tolist():
-            missing.append(c)
+    df.columns = df.columns.str.strip().str.lower()
+    found = set(df.columns)
+    missing = [c for c in MIDATA_COLUMNS if c not in found]
     if missing:
         # Create comma-separated list of columns and replace the last , with and
         msg = ", ".join(f"'{s}'" for s in missing)
         msg = " and".join(msg.rsplit(",", 1))
-        print(msg)
         raise ban_errors.MidataCSVError(
             f"the following columns are missing from midata CSV: {msg}"
         )
     # Drop any columns that aren't needed
-    df = df.loc[:, columns]
+    df = df.loc[:, MIDATA_COLUMNS]
     rename = {"merchant/description": "description", "debit/credit": "amount"}
     return df.rename(columns=rename)
@@ -8,6 +8,9 @@
 import logging
 from logging import handlers
 
+# Third party imports
+import numpy as np
+
 
 ##### CONSTANTS #####
 LOG = logging.getLogger(__name__)
@@ -54,3 +57,51 @@ class Logger:
         else:
             LOG.info("Program completed without any critical errors")
         logging.shutdown()
+
+
+##### FUNCTIONS #####
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Downsample a line using the Largest-Triangle-Three-Buckets algorithm.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Numeric x values of the line, should be sorted in
+        ascending order.
+    y : np.ndarray
+        Numeric y values of the line, same length as `x`.
+    threshold : int
+        Maximum number of points to keep, the first and last
+        points are always kept.
+
+    Returns
+    -------
+    np.ndarray
+        Indices of the points to keep, if `x` has no more than
+        `threshold` points (or `threshold` < 3) then all indices
+        are returned.
+    """
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    # Bucket edges for the points between the first and last
+    edges = np.linspace(1, length - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = length - 1
+
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket, or the last point for the final bucket
+        next_end = edges[i + 2] if i + 2 < len(edges) else length
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+    return indices
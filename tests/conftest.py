@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""
+    Pytest configuration, adds the `src` folder to the path so
+    the banalysis package can be imported without installing.
+"""
+
+##### IMPORTS #####
+# Standard imports
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
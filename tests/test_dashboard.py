@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+    Tests for the dashboard module.
+"""
+
+##### IMPORTS #####
+# Standard imports
+import base64
+
+# Third party imports
+import numpy as np
+import pytest
+from bokeh.document import Document
+
+# Local imports
+from banalysis import dashboard, errors, inputs
+
+##### CONSTANTS #####
+MIDATA_CSV = (
+    "Date,Type,Merchant/Description,Debit/Credit,Balance\n"
+    "02/03/2021,CR,SALARY,+£2000.00,+£3087.50\n"
+    "01/03/2021,DEB,TESCO,-£12.50,+£1087.50\n"
+)
+
+##### FUNCTIONS #####
+def _upload(csv: str) -> tuple:
+    """Upload CSV to a new dashboard and wait for it to be parsed.
+
+    Parameters
+    ----------
+    csv : str
+        Contents of the CSV file to upload.
+
+    Returns
+    -------
+    Dashboard
+        Dashboard the file was uploaded to.
+    list
+        Callbacks which were added with `add_next_tick_callback`.
+    """
+    doc = Document()
+    callbacks = []
+    doc.add_next_tick_callback = callbacks.append
+    dash = dashboard.Dashboard(doc)
+    dash._update_source("value", None, base64.b64encode(csv.encode()).decode())
+    # Waits for the parsing thread, which schedules the tick callback, to finish
+    dash._executor.shutdown(wait=True)
+    return dash, callbacks
+
+
+def _dates(*dates: str) -> np.ndarray:
+    """Convert date strings to datetime64 array."""
+    return np.array(dates, dtype="datetime64[ns]")
+
+
+##### TESTS #####
+def test_downsample_balance_newest_first():
+    """Test newest first dates are reversed, keeping file order within a day."""
+    date = _dates("2021-03-02", "2021-03-01", "2021-03-01")
+    # Same day rows listed newest first, so the last row is the first transaction
+    data = dashboard._downsample_balance(date, np.array([30.0, 20.0, 10.0]))
+    np.testing.assert_array_equal(
+        data["date"], _dates("2021-03-01", "2021-03-01", "2021-03-02")
+    )
+    np.testing.assert_array_equal(data["balance"], [10.0, 20.0, 30.0])
+
+
+def test_downsample_balance_unsorted():
+    """Test unsorted dates are sorted."""
+    date = _dates("2021-03-02", "2021-03-01", "2021-03-03")
+    data = dashboard._downsample_balance(date, np.array([20.0, 10.0, 30.0]))
+    np.testing.assert_array_equal(
+        data["date"], _dates("2021-03-01", "2021-03-02", "2021-03-03")
+    )
+    np.testing.assert_array_equal(data["balance"], [10.0, 20.0, 30.0])
+
+
+def test_downsample_balance_max_points():
+    """Test line is downsampled and keeps the first and last dates."""
+    length = dashboard.MAX_LINE_POINTS * 3
+    date = np.datetime64("2015-01-01", "ns") + np.arange(length).astype(
+        "timedelta64[D]"
+    )
+    balance = np.sin(np.arange(length) / 100)
+    data = dashboard._downsample_balance(date, balance)
+    assert len(data["date"]) <= dashboard.MAX_LINE_POINTS
+    assert data["date"][0] == date[0]
+    assert data["date"][-1] == date[-1]
+
+
+def test_update_source():
+    """Test uploaded file is parsed in the background and applied on the next tick."""
+    dash, callbacks = _upload(MIDATA_CSV)
+    assert len(callbacks) == 1
+    assert len(dash.source.data["date"]) == 0
+
+    callbacks[0]()
+    np.testing.assert_array_equal(dash.source.data["amount"], [2000.0, -12.5])
+    np.testing.assert_array_equal(dash.line_source.data["balance"], [1087.5, 3087.5])
+    assert dash.all_plot.y_range.bounds == (0, 4000)
+
+
+def test_update_source_error():
+    """Test errors from parsing are raised when the tick callback is run."""
+    dash, callbacks = _upload("Date,Type\n01/03/2021,DEB\n")
+    assert len(callbacks) == 1
+    with pytest.raises(errors.MidataCSVError):
+        callbacks[0]()
+    assert len(dash.source.data["date"]) == 0
+
+
+def test_session_destroyed():
+    """Test the parsing thread is shutdown when the session is destroyed."""
+    doc = Document()
+    dash = dashboard.Dashboard(doc)
+    for callback in doc.session_destroyed_callbacks:
+        callback(None)
+    with pytest.raises(RuntimeError):
+        dash._executor.submit(print)
+
+
+def test_column_array():
+    """Test midata columns are converted to plain numpy arrays for the source."""
+    df = inputs.read_midata_arrow(MIDATA_CSV.encode())
+    # Add missing values to the string and categorical columns
+    df.loc[1, "description"] = None
+    df["type"] = df["type"].cat.set_categories(["CR"])
+    data = {c: dashboard._column_array(df[c]) for c in df.columns}
+
+    for c in ("type", "description", "colour"):
+        assert isinstance(data[c], np.ndarray)
+        assert data[c].dtype == object
+    assert data["type"].tolist() == ["CR", ""]
+    assert data["description"].tolist() == ["SALARY", ""]
+
+    for c in ("amount", "balance", "abs_amount"):
+        assert isinstance(data[c], np.ndarray)
+        assert data[c].dtype == np.float64
+    np.testing.assert_array_equal(data["amount"], [2000.0, -12.5])
+    assert isinstance(data["date"], np.ndarray)
+    assert data["date"].dtype == np.dtype("datetime64[ns]")
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+    Tests for the inputs module.
+"""
+
+##### IMPORTS #####
+# Standard imports
+import io
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local imports
+from banalysis import inputs
+
+##### CONSTANTS #####
+MIDATA_CSV = (
+    "Date,Type,Merchant/Description,Debit/Credit,Balance\n"
+    "01/03/2021,DEB,TESCO,-£12.50,+£1087.50\n"
+    "02/03/2021,CR,SALARY,+£2000.00,+£3087.50\n"
+)
+
+##### TESTS #####
+def test_read_midata():
+    """Test values are converted when reading midata CSV."""
+    df = inputs.read_midata(io.BytesIO(MIDATA_CSV.encode()))
+    assert df.columns.tolist() == [
+        "date",
+        "type",
+        "description",
+        "amount",
+        "balance",
+        "abs_amount",
+        "colour",
+    ]
+    np.testing.assert_array_equal(df["amount"].to_numpy(), [-12.5, 2000])
+    np.testing.assert_array_equal(df["balance"].to_numpy(), [1087.5, 3087.5])
+    assert df["colour"].tolist() == ["red", "green"]
+
+
+def test_read_midata_short_footer():
+    """Test footer row with fewer fields than the header is dropped."""
+    csv = MIDATA_CSV + "Arranged overdraft limit,01/03/2021,+£500.00\n"
+    df = inputs.read_midata(io.BytesIO(csv.encode()))
+    assert len(df) == 2
+    assert df["description"].tolist() == ["TESCO", "SALARY"]
+
+
+def test_read_midata_full_footer():
+    """Test footer row with the same number of fields as the header is dropped."""
+    csv = MIDATA_CSV + "Arranged overdraft limit,01/03/2021,,,+£500.00\r\n\r\n"
+    df = inputs.read_midata(io.BytesIO(csv.encode()))
+    assert len(df) == 2
+    assert df["description"].tolist() == ["TESCO", "SALARY"]
+
+
+def test_read_midata_text_mode():
+    """Test a clear error is raised for text mode file-like objects."""
+    with pytest.raises(TypeError, match="binary mode"):
+        inputs.read_midata(io.StringIO(MIDATA_CSV))
+
+
+def test_read_midata_arrow_short_footer():
+    """Test footer row with fewer fields is dropped when reading from bytes."""
+    csv = MIDATA_CSV + "Arranged overdraft limit,01/03/2021,+£500.00\n"
+    df = inputs.read_midata_arrow(csv.encode())
+    assert len(df) == 2
+    assert df["description"].tolist() == ["TESCO", "SALARY"]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+    Tests for the utils module.
+"""
+
+##### IMPORTS #####
+# Third party imports
+import numpy as np
+
+# Local imports
+from banalysis import utils
+
+##### TESTS #####
+def test_lttb_indices():
+    """Test downsampled indices keep the first and last points."""
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 50)
+    indices = utils.lttb_indices(x, y, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_indices_below_threshold():
+    """Test all indices are returned when there are fewer points than threshold."""
+    x = np.arange(10, dtype=np.float64)
+    np.testing.assert_array_equal(utils.lttb_indices(x, x, 10), np.arange(10))
+    np.testing.assert_array_equal(utils.lttb_indices(x, x, 20), np.arange(10))